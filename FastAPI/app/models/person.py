@@ -1,19 +1,20 @@
 """
-This module defines the `Person`, `User`, and `Admin` models along with the `RoleEnum` enumeration.
+This module defines the `Person` and `User` models along with the `RoleEnum` enumeration.
 
 The `Person` model includes attributes such as ID, name, email, password, and role.
-The `User` and `Admin` models inherit from the `Person` model and represent specific
- types of persons with roles 'User' and 'Admin' respectively.
+The `User` model inherits from the `Person` model and is the request body used for
+ every person, whatever its role; the role itself is carried by the `role` field.
+The `UserOut` model is what the API returns for a person, without the password.
 
 Classes:
     RoleEnum: Enumeration for the role of a person.
     Person: Represents a person with various attributes.
     User: Represents a user who inherits from the Person class.
-    Admin: Represents an admin who inherits from the Person class.
+    UserOut: Represents a user as returned by the API.
 """
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class RoleEnum(str, Enum):
     """
@@ -37,6 +38,9 @@ class Person(BaseModel):
         password (str): The password for the person's account.
         role (RoleEnum): The role of the person, which can be either 'Admin' or 'User'.
     """
+    # Request bodies are never modified, and unknown fields are rejected
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     email: str
     password: str
@@ -50,10 +54,19 @@ class User(Person):
     but serves as a specific type of Person with a 'User' role.
     """
 
-class Admin(Person):
+class UserOut(BaseModel):
     """
-    Represents an admin who inherits from the Person class.
+    Represents a user as returned by the API; the password is never included.
 
-    This class does not add any additional attributes or methods
-    but serves as a specific type of Person with an 'Admin' role.
+    Attributes:
+        id (int): The unique identifier for the user.
+        name (str): The name of the user.
+        email (str): The email address of the user.
+        role (RoleEnum): The role of the user, which can be either 'Admin' or 'User'.
     """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: str
+    role: RoleEnum
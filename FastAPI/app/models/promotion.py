@@ -62,5 +62,5 @@ class Promotion(BaseModel):
     startTime: datetime
     endTime: datetime
     status: PromotionStatusEnum
-    reservation: Optional["Reservation"]
+    reservation: Optional[Reservation]
     createdBy: str
@@ -10,8 +10,7 @@ Classes:
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel
-from pydantic.v1.class_validators import root_validator
+from pydantic import BaseModel, model_validator
 
 
 class ScheduleStatusEnum(str, Enum):
@@ -40,24 +39,17 @@ class Schedule(BaseModel):
     closing_time: datetime
     status: ScheduleStatusEnum
 
-    @classmethod
-    @root_validator(pre=True)
-    def validate_times(cls, values):
+    @model_validator(mode="after")
+    def validate_times(self):
         """
         Validate that the closing time is greater than the opening time.
-    
-        Args:
-            cls (Type[Schedule]): The class being validated.
-            values (dict): The values to validate.
-    
+
         Returns:
-            dict: The validated values.
-    
+            Schedule: The validated schedule.
+
         Raises:
             ValueError: If closing_time is not greater than opening_time.
         """
-        opening_time = values.get('opening_time')
-        closing_time = values.get('closing_time')
-        if opening_time and closing_time and closing_time <= opening_time:
+        if self.closing_time <= self.opening_time:
             raise ValueError("closing_time must be greater than opening_time")
-        return values
+        return self
@@ -3,7 +3,7 @@ This module defines two data models: Token and TokenData.
 
 Classes:
     Token: Represents a token used for authentication.
-    TokenData: Represents additional data associated with a token, such as a email.
+    TokenData: Represents additional data associated with a token, such as a email and role.
 """
 from typing import Optional
 from pydantic import BaseModel
@@ -26,5 +26,9 @@ class TokenData(BaseModel):
 
     Attributes:
     email (Optional[str]): The email associated with the token, if available.
+    user_id (Optional[int]): The ID of the user the token was issued to, if available.
+    role (Optional[str]): The role the user had when the token was issued, if available.
     """
     email: Optional[str] = None
+    user_id: Optional[int] = None
+    role: Optional[str] = None
@@ -7,10 +7,11 @@ available schedules, and the user who created it.
 Classes:
     WorkspaceEnum: Enumeration for the type of workspace.
     Workspace: Represents a workspace with various attributes.
+    WorkspaceUpdate: Represents a partial update of a workspace.
 """
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorkspaceEnum(str, Enum):
@@ -38,8 +39,30 @@ class Workspace(BaseModel):
         availableSchedules (list): A list of available schedules for the workspace.
         createdBy (str): The user who created the workspace.
     """
+    # Request bodies are never modified, and unknown fields are rejected
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: WorkspaceEnum
     capacity: int = Field(..., gt=0, description="Capacity must be greater than 0")
     hourlyRate: float = Field(..., gt=0, description="Hourly rate must be positive")
     availableSchedules: list
     createdBy: str
+
+class WorkspaceUpdate(BaseModel):
+    """
+    Represents a partial update of a workspace; only the fields sent are changed.
+
+    A field sent as null is rejected rather than written, since every column is NOT NULL.
+
+    Attributes:
+        type (WorkspaceEnum, optional): The new type of the workspace.
+        capacity (int, optional): The new capacity of the workspace.
+        hourlyRate (float, optional): The new hourly rate of the workspace.
+        createdBy (str, optional): The new creator of the workspace.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    type: WorkspaceEnum = None
+    capacity: int = Field(None, gt=0, description="Capacity must be greater than 0")
+    hourlyRate: float = Field(None, gt=0, description="Hourly rate must be positive")
+    createdBy: str = None
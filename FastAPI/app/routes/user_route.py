@@ -18,22 +18,34 @@ as well as a login endpoint for obtaining an access token.
 
 ### Models:
 - `User`: Represents the user data model.
+- `UserOut`: Represents a user as returned by the API, without the password.
 - `Token`: Represents the token schema returned after successful login.
 """
 
+# Standard library imports
+from typing import Annotated
+
 # Third-party imports
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Path
 from fastapi.security import OAuth2PasswordRequestForm
 
 # Local application/library specific imports
-from models.person import User
+from database import get_db
+from helpers.api_key_auth import get_api_key
+from models.person import User, UserOut
 from models.token_schema import Token
 from services.auth_service import generate_token
 from services.user_service import UserService
 
-user_route = APIRouter()
+user_route = APIRouter(dependencies=[Depends(get_api_key), Depends(get_db)])
+
+# IDs are positive, so anything else is rejected before reaching the database
+UserId = Annotated[int, Path(ge=1)]
 
-@user_route.get("/")
+@user_route.get(
+    "/",
+    response_model=list[UserOut]
+)
 def get_user():
     """
     Retrieves a list of all users.
@@ -43,8 +55,11 @@ def get_user():
     """
     return UserService.get_users()
 
-@user_route.get("/{user_id}")
-def get_user_by_id(user_id: int):
+@user_route.get(
+    "/{user_id}",
+    response_model=UserOut
+)
+def get_user_by_id(user_id: UserId):
     """
     Retrieves a specific user by their ID.
 
@@ -56,7 +71,10 @@ def get_user_by_id(user_id: int):
     """
     return UserService.get_user(user_id)
 
-@user_route.post("/")
+@user_route.post(
+    "/",
+    response_model=UserOut
+)
 def create_user(user: User = Body(...)):
     """
     Create a new user in the app.
@@ -72,8 +90,11 @@ def create_user(user: User = Body(...)):
     """
     return UserService.create_user(user)
 
-@user_route.put("/{user_id}")
-def update_user(user_id: int, user: User = Body(...)):
+@user_route.put(
+    "/{user_id}",
+    response_model=UserOut
+)
+def update_user(user_id: UserId, user: User = Body(...)):
     """
     Updates an existing user by their ID.
 
@@ -87,7 +108,7 @@ def update_user(user_id: int, user: User = Body(...)):
     return UserService.update_user(user_id, user)
 
 @user_route.delete("/{user_id}")
-def delete_user(user_id: int):
+def delete_user(user_id: UserId):
     """
     Deletes a user by their ID.
 
@@ -103,7 +124,7 @@ def delete_user(user_id: int):
     "/login",
     response_model=Token
 )
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
+def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     Logs in a user and returns an access token.
 
@@ -10,21 +10,28 @@ Routes:
     - POST /workspaces/{workspace_id}/schedules: Add a new schedule to a workspace.
     - DELETE /schedules/{schedule_id}: Delete a specific schedule by ID.
 """
-from http.client import HTTPException
+from typing import Annotated
 
 
-from database import PersonModel # pylint: disable=import-error
-from helpers.api_key_auth import admin_required # pylint: disable=import-error
-from models.workspace import Workspace # pylint: disable=import-error
+from database import get_db # pylint: disable=import-error
+from helpers.api_key_auth import admin_required, get_api_key # pylint: disable=import-error
+from models.workspace import Workspace, WorkspaceUpdate # pylint: disable=import-error
 from models.schedule import Schedule # pylint: disable=import-error
 from services.workspace_service import WorkspaceService # pylint: disable=import-error
-from services import schedule_service # pylint: disable=import-error
+from services.schedule_service import ScheduleService # pylint: disable=import-error
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from fastapi.responses import ORJSONResponse
 
-workspace_route = APIRouter()
+workspace_route = APIRouter(dependencies=[Depends(get_api_key), Depends(get_db)])
+# Mutating routes, all restricted to admins; mounted on workspace_route below
+admin_route = APIRouter(dependencies=[Depends(admin_required)])
 workspace_service = WorkspaceService()
-schedule_service = schedule_service.ScheduleService()
+schedule_service = ScheduleService()
+
+# IDs are positive, so anything else is rejected before reaching the database
+WorkspaceId = Annotated[int, Path(ge=1)]
+ScheduleId = Annotated[int, Path(ge=1)]
 
 @workspace_route.get("/")
 def get_workspaces():
@@ -32,12 +39,12 @@ def get_workspaces():
     Retrieve a list of all workspaces.
 
     Returns:
-        list: A list of workspace objects.
+        list: A list of workspace objects, serialized directly by orjson.
     """
-    return workspace_service.get_workspaces()
+    return ORJSONResponse(workspace_service.get_workspaces())
 
 @workspace_route.get("/{workspace_id}")
-def get_workspace(workspace_id: int):
+def get_workspace(workspace_id: WorkspaceId):
     """
     Retrieve a specific workspace by its ID.
 
@@ -46,54 +53,49 @@ def get_workspace(workspace_id: int):
 
     Returns:
         dict: A dictionary containing the workspace details and its schedules,
-              or a message indicating the workspace was not found.
+              or a message indicating the workspace was not found, serialized
+              directly by orjson.
     """
-    return workspace_service.get_workspace(workspace_id)
+    return ORJSONResponse(workspace_service.get_workspace(workspace_id))
 
-@workspace_route.post("/")
+@admin_route.post("/")
 def create_workspace(
-    workspace: Workspace = Body(...),
-    _current_user: PersonModel = Depends(admin_required)
+    workspace: Workspace = Body(...)
 ):
     """
     Create a new workspace.
 
     Args:
         workspace (Workspace): The workspace object to create.
-        _current_user (PersonModel): The current user, must be an admin.
 
     Returns:
         dict: The created workspace object.
     """
     return workspace_service.create_workspace(workspace)
 
-@workspace_route.put("/{workspace_id}")
+@admin_route.put("/{workspace_id}")
 def update_workspace(
-        workspace_id: int,
-        workspace_data: dict,
-        _current_user: PersonModel = Depends(admin_required)):
+        workspace_id: WorkspaceId,
+        workspace_data: WorkspaceUpdate):
     """
     Update an existing workspace.
 
     Args:
-        _current_user: The current user, must be an admin.
         workspace_id (int): The ID of the workspace to update.
-        workspace_data (dict): A dictionary containing the updated workspace data.
+        workspace_data (WorkspaceUpdate): The workspace fields to change.
 
     Returns:
         str: A message indicating whether the update was successful.
     """
     return workspace_service.update_workspace(workspace_id, workspace_data)
 
-@workspace_route.delete("/{workspace_id}")
+@admin_route.delete("/{workspace_id}")
 def delete_workspace(
-        workspace_id: int,
-        _current_user: PersonModel = Depends(admin_required)):
+        workspace_id: WorkspaceId):
     """
     Delete a workspace and its schedules.
 
     Args:
-        _current_user: PersonModel: The current user, must be an admin.
         workspace_id (int): The ID of the workspace to delete.
 
     Returns:
@@ -101,17 +103,15 @@ def delete_workspace(
     """
     return workspace_service.delete_workspace(workspace_id)
 
-@workspace_route.post("/{workspace_id}/schedules")
+@admin_route.post("/{workspace_id}/schedules")
 def add_schedule(
-        workspace_id: int, schedule: Schedule,
-        _current_user: PersonModel = Depends(admin_required)):
+        workspace_id: WorkspaceId, schedule: Schedule):
     """
     Add a new schedule to a workspace.
 
     Args:
         workspace_id (int): The ID of the workspace to which the schedule will be added.
         schedule (Schedule): The schedule object containing the details of the schedule.
-        _current_user (PersonModel): The current user, must be an admin.
 
     Returns:
         str: A message indicating whether the schedule was added successfully.
@@ -128,19 +128,19 @@ def add_schedule(
         raise HTTPException(status_code=404, detail="Workspace not found")
     return result
 
-@workspace_route.delete("/schedules/{schedule_id}")
+@admin_route.delete("/schedules/{schedule_id}")
 def delete_schedule(
-        schedule_id: int,
-        _current_user: PersonModel = Depends(admin_required)
+        schedule_id: ScheduleId
 ):
     """
     Delete a specific schedule by ID.
 
     Args:
-        _current_user:
         schedule_id (int): The ID of the schedule to delete.
 
     Returns:
         str: A message indicating whether the deletion was successful.
     """
     return schedule_service.delete_schedule(schedule_id)
+
+workspace_route.include_router(admin_route)
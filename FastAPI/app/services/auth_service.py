@@ -6,9 +6,6 @@ and user verification using JWT (JSON Web Tokens).
 
 ### Functions:
 
-- `verify_password(plain_password, password)`: 
-  Verifies a plain password against a hashed password.
-  
 - `get_password_hash(password)`: 
   Hashes a plain password.
 
@@ -29,7 +26,7 @@ and user verification using JWT (JSON Web Tokens).
 
 ### Dependencies:
 - `fastapi`: Web framework for building APIs.
-- `jose`: Library for encoding and decoding JSON Web Tokens.
+- `jwt`: PyJWT, library for encoding and decoding JSON Web Tokens.
 - `passlib`: Library for password hashing.
 - `models.token_schema`: Contains the data model for token data.
 - `database`: Contains configuration for database connection and secret keys.
@@ -41,32 +38,30 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 
 from models.token_schema import TokenData
 from database import secret_key, token_expire, PersonModel
 
 SECRET_KEY = secret_key
+# Signing key as bytes, encoded once instead of on every encode/decode
+_SECRET_KEY_BYTES = SECRET_KEY.encode() if SECRET_KEY else None
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = token_expire
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; existing bcrypt hashes still verify and are
+# upgraded to argon2id the next time their owner logs in.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/login")
 
-def verify_password(plain_password, password):
-    """
-    Verifies a plain password against a hashed password.
-
-    ### Args
-    - plain_password (str): The plain text password.
-    - password (str): The hashed password to verify against.
-
-    ### Returns
-    - bool: True if the passwords match, otherwise False.
-    """
-    return pwd_context.verify(plain_password, password)
-
 def get_password_hash(password):
     """
     Hashes a plain password.
@@ -89,15 +84,14 @@ def get_user(email: str):
     ### Returns
     - PersonModel: The user object if found, otherwise None.
     """
-    return PersonModel.filter(
-        (PersonModel.email == email) |
-        (PersonModel.email == email)
-    ).first()
+    return PersonModel.get_or_none(PersonModel.email == email)
 
 def authenticate_user(email: str, password: str):
     """
     Authenticates a user based on their email and password.
 
+    A password stored with a deprecated hash is rehashed and saved on success.
+
     ### Args
     - email (str): The user's email address.
     - password (str): The user's password.
@@ -109,8 +103,12 @@ def authenticate_user(email: str, password: str):
     user = get_user(email)
     if not user:
         return False
-    if not verify_password(password, user.password):
+    verified, new_hash = pwd_context.verify_and_update(password, user.password)
+    if not verified:
         return False
+    if new_hash:
+        user.password = new_hash
+        user.save()
     return user
 
 def create_access_token(data: dict,
@@ -133,7 +131,7 @@ def create_access_token(data: dict,
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode,
-                              SECRET_KEY,
+                              _SECRET_KEY_BYTES,
                               algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -160,14 +158,19 @@ def generate_token(email, password):
         )
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     return create_access_token(
-        data={"sub": user.email},
+        data={"sub": user.email, "uid": user.id, "role": user.role},
         expires_delta=access_token_expires
     )
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
+def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     Retrieves the current user from the access token.
 
+    The user is built from the token's `uid` and `role` claims without
+    touching the database, so a role change only takes effect once the
+    token is reissued; older tokens without these claims fall back to a
+    lookup by email.
+
     ### Args
     - token (str): The access token.
 
@@ -183,15 +186,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError as exc:
+        token_data = TokenData(email=email, user_id=payload.get("uid"), role=payload.get("role"))
+    except jwt.InvalidTokenError as exc:
         raise credentials_exception from exc
 
-    user = get_user(email=token_data.email)
+    if token_data.user_id is not None and token_data.role is not None:
+        user = PersonModel(id=token_data.user_id, email=token_data.email, role=token_data.role)
+    else:
+        user = get_user(email=token_data.email)
     if user is None:
         raise credentials_exception
     return user
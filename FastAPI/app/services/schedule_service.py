@@ -14,8 +14,8 @@ Methods:
     delete_schedule(schedule_id: int) -> str:
         Deletes a specific schedule by ID.
 """
-from peewee import DoesNotExist
 from database import WorkspaceModel, ScheduleModel # pylint: disable=import-error
+from services.workspace_service import invalidate_workspaces_cache # pylint: disable=import-error
 
 class ScheduleService:
     """
@@ -33,17 +33,16 @@ class ScheduleService:
         Returns:
             str: A message indicating the result of the operation.
         """
-        try:
-            workspace = WorkspaceModel.get(WorkspaceModel.id == workspace_id)
-            ScheduleModel.create(
-                opening_time=schedule_data['opening_time'],
-                closing_time=schedule_data['closing_time'],
-                status=schedule_data['status'],
-                workspace=workspace
-            )
-            return "Schedule added successfully"
-        except DoesNotExist:
+        if not WorkspaceModel.select().where(WorkspaceModel.id == workspace_id).exists():
             return "Workspace not found"
+        ScheduleModel.create(
+            opening_time=schedule_data['opening_time'],
+            closing_time=schedule_data['closing_time'],
+            status=schedule_data['status'],
+            workspace=workspace_id
+        )
+        invalidate_workspaces_cache()
+        return "Schedule added successfully"
 
     def delete_schedule(self, schedule_id: int) -> str:
         """
@@ -55,9 +54,8 @@ class ScheduleService:
         Returns:
             str: A message indicating the result of the operation.
         """
-        try:
-            schedule = ScheduleModel.get(ScheduleModel.id == schedule_id)
-            schedule.delete_instance()
-            return "Schedule deleted successfully"
-        except DoesNotExist:
+        deleted = ScheduleModel.delete().where(ScheduleModel.id == schedule_id).execute()
+        if not deleted:
             return "Schedule not found"
+        invalidate_workspaces_cache()
+        return "Schedule deleted successfully"
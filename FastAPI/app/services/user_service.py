@@ -8,19 +8,57 @@ for error handling. The operations include retrieving all users, creating
 new users with validation, updating user details, and deleting users.
 
 Imports:
-    - DoesNotExist, IntegrityError (Peewee exceptions)
+    - IntegrityError (Peewee exception)
     - Body, HTTPException (FastAPI tools)
     - User (Pydantic model for user data)
     - UserModel (Peewee model for database interaction)
 """
 
-from peewee import DoesNotExist, IntegrityError
+import re
+
+from peewee import IntegrityError
 
 from models.person import User # pylint: disable=import-error
 from database import PersonModel # pylint: disable=import-error
 from services.auth_service import get_password_hash # pylint: disable=import-error
+from helpers.api_key_auth import invalidate_role # pylint: disable=import-error
 from fastapi import Body, HTTPException
 
+# Local part, '@', then a domain with at least one dot; no whitespace anywhere
+_EMAIL_MATCH = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+').fullmatch
+
+# Password character classes, looked up per byte so one pass finds all of them
+_DIGIT, _LETTER, _SPECIAL = 1, 2, 4
+_PASSWORD_CLASSES = bytes(
+    _DIGIT if bytes([byte]).isdigit() else
+    _LETTER if bytes([byte]).isalpha() else
+    _SPECIAL if byte in b'@$!%*?&' else 0
+    for byte in range(256)
+)
+
+def _validate_password(password: str):
+    """
+    Enforce the password rules with a single pass over the password.
+
+    Args:
+        password (str): The plain text password to check.
+
+    Raises:
+        HTTPException: If the password breaks any of the rules.
+    """
+    if len(password) < 8:
+        raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
+
+    classes = set(password.encode().translate(_PASSWORD_CLASSES))
+    if _DIGIT not in classes:
+        raise HTTPException(status_code=400, detail="Password must contain at least one number")
+
+    if _LETTER not in classes:
+        raise HTTPException(status_code=400, detail="Password must contain at least one letter")
+
+    if _SPECIAL not in classes:
+        raise HTTPException(status_code=400, detail="Password must contain a special character")
+
 
 class UserService:
     """
@@ -37,11 +75,20 @@ class UserService:
         """
         Retrieve all users from the database.
 
+        Rows are read as plain dictionaries straight off the cursor, so no model
+        instance is built per user and the query keeps no second copy of the rows.
+        The password hash is never selected.
+
         Returns:
-            List[UserModel]: A list of all users.
+            List[dict]: A list of all users, without their passwords.
         """
-        users = list(PersonModel.select())
-        return users
+        return list(
+            PersonModel.select(
+                PersonModel.id, PersonModel.name, PersonModel.email, PersonModel.role
+            )
+            .dicts()
+            .iterator()
+        )
 
     @staticmethod
     def get_user(user_id: int):
@@ -57,11 +104,10 @@ class UserService:
         Raises:
             HTTPException: If the user is not found in the database.
         """
-        try:
-            user = PersonModel.get(PersonModel.id == user_id)
-            return user
-        except DoesNotExist as exc:
-            raise HTTPException(status_code=404, detail="User not found") from exc
+        user = PersonModel.get_or_none(PersonModel.id == user_id)
+        if user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user
 
     @staticmethod
     def create_user(user: User = Body(...)):
@@ -72,42 +118,28 @@ class UserService:
             user (User): A Pydantic model instance representing the new user data.
 
         Returns:
-            UserModel: The created user object.
+            dict: The created user's ID, name, email, and role.
 
         Raises:
             HTTPException: If any validation fails or the user already exists.
         """
         # Password validation
-        if len(user.password) < 8:
-            raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
-
-        if not any(char.isdigit() for char in user.password):
-            raise HTTPException(status_code=400, detail="Password must contain at least one number")
+        _validate_password(user.password)
 
-        if not any(char.isalpha() for char in user.password):
-            raise HTTPException(status_code=400, detail="Password must contain at least one letter")
-
-        if not any(char in '@$!%*?&' for char in user.password):
-            raise HTTPException(status_code=400, detail="Password must contain a special character")
+        if not _EMAIL_MATCH(user.email):
+            raise HTTPException(status_code=400,
+            detail="Email must contain an '@' and a domain (e.g., '@gmail.com')"
+            )
 
         try:
-            for existing_user in PersonModel.select():
-                if existing_user.email == user.email:
-                    raise HTTPException(status_code=400, detail="User already exists")
-
-            if "@" not in user.email or not user.email.split('@')[-1]:
-                raise HTTPException(status_code=400,
-                detail="Email must contain an '@' and a domain (e.g., '@gmail.com')"
-                )
-            # Create the user
-            created_user = PersonModel.create(
+            # A duplicate email is rejected by the unique index on person.email
+            user_id = PersonModel.insert(  # pylint: disable=no-value-for-parameter
                 name=user.name,
                 email=user.email,
                 password=get_password_hash(user.password),
                 role=user.role
-            )
-            print(created_user)
-            return created_user
+            ).execute()
+            return {"id": user_id, "name": user.name, "email": user.email, "role": user.role}
 
         except IntegrityError as exc:
             raise HTTPException(status_code=400, detail="User already exists") from exc
@@ -122,58 +154,41 @@ class UserService:
             user (User): A Pydantic model instance representing the updated user data.
 
         Returns:
-            UserModel: The updated user.
+            dict: The updated user's ID, name, email, and role.
 
         Raises:
             HTTPException: If the user is not found or the update fails.
         """
         try:
-            # Find the user to update
-            existing_user = PersonModel.get(PersonModel.id == user_id)
-
             # Password validation if it is to be updated
-            if user.password and len(user.password) < 8:
-                raise HTTPException(
-                    status_code=400, detail="Password must be at least 8 characters"
-                    )
-
-            if user.password and not any(char.isdigit() for char in user.password):
-                raise HTTPException(
-                    status_code=400, detail="Password must contain at least one number"
-                    )
-            if user.password and not any(char.isalpha() for char in user.password):
-                raise HTTPException(
-                    status_code=400, detail="Password must contain at least one letter"
-                    )
-
-            if user.password and not any(char in '@$!%*?&' for char in user.password):
-                raise HTTPException(
-                    status_code=400, detail="Password must contain a special character"
-                    )
-
-            if "@" not in user.email or not user.email.split('@')[-1]:
+            if user.password:
+                _validate_password(user.password)
+
+            if not _EMAIL_MATCH(user.email):
                 raise HTTPException(status_code=400,
                 detail="Email must contain an '@' and a domain (e.g., '@gmail.com')")
 
-            # Check if another user with the same email already exists
-            for existing_user in PersonModel.select():
-                if existing_user.email == user.email:
-                    raise HTTPException(status_code=400, detail="User already exists")
-
-            # Update the user's information
-            existing_user.name = user.name or existing_user.name
-            existing_user.email = user.email or existing_user.email
-            existing_user.password = get_password_hash(user.password) or existing_user.password
-            existing_user.role = user.role or existing_user.role
+            # Update only the columns that were sent, in one statement; an email
+            # taken by another user is rejected by the unique index on person.email
+            changes = {PersonModel.email: user.email, PersonModel.role: user.role}
+            if user.name:
+                changes[PersonModel.name] = user.name
+            if user.password:
+                changes[PersonModel.password] = get_password_hash(user.password)
+            updated = PersonModel.update(changes).where(PersonModel.id == user_id).execute()
+
+            # MySQL counts changed rows, so an unchanged user also reports zero
+            if not updated and not PersonModel.select().where(PersonModel.id == user_id).exists():
+                raise HTTPException(status_code=404, detail="User not found")
+            invalidate_role(user_id)
+
+            if not user.name:
+                # An empty name keeps the stored one, so read it back for the response
+                return PersonModel.get_by_id(user_id)
+            return {"id": user_id, "name": user.name, "email": user.email, "role": user.role}
 
-            # Save changes to the database
-            existing_user.save()
-            return existing_user
-
-        except DoesNotExist as exc:
-            raise HTTPException(status_code=404, detail="User not found") from exc
         except IntegrityError as exc:
-            raise HTTPException(status_code=400, detail="Could not update user") from exc
+            raise HTTPException(status_code=400, detail="User already exists") from exc
 
     @staticmethod
     def delete_user(user_id: int):
@@ -189,9 +204,8 @@ class UserService:
         Raises:
             HTTPException: If the user is not found in the database.
         """
-        try:
-            person = PersonModel.get(PersonModel.id == user_id)
-            person.delete_instance()
-            return {"status": "User deleted successfully"}
-        except DoesNotExist as exc:
-            raise HTTPException(status_code=404, detail="User not found") from exc
+        deleted = PersonModel.delete().where(PersonModel.id == user_id).execute()
+        if not deleted:
+            raise HTTPException(status_code=404, detail="User not found")
+        invalidate_role(user_id)
+        return {"status": "User deleted successfully"}
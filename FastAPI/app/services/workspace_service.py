@@ -4,6 +4,9 @@ This module provides services for managing workspaces and their schedules.
 Classes:
     - WorkspaceService: A service class for managing workspaces and their schedules.
 
+Functions:
+    - invalidate_workspaces_cache: Drops the cached workspace listing.
+
 Methods:
     - get_workspaces: Retrieves all workspaces, including their schedules.
     - get_workspace: Retrieves a specific workspace along with its schedules.
@@ -11,16 +14,36 @@ Methods:
     - update_workspace: Updates an existing workspace.
     - delete_workspace: Deletes a workspace and its schedules if no future schedules are assigned.
 """
-from datetime import datetime
+from threading import Lock
 
-from peewee import DoesNotExist
+from cachetools import TTLCache
+from peewee import SQL, prefetch
 
 from database import (WorkspaceModel, ScheduleModel)
-from models.workspace import Workspace
+from models.workspace import Workspace, WorkspaceUpdate
 
 from fastapi import Body
 # pylint: enable=unused-import
 
+# The workspace listing is read on every page load, so it is kept for a short time
+_workspaces_cache = TTLCache(maxsize=1, ttl=30)
+_workspaces_cache_lock = Lock()
+# Bumped by every invalidation; a listing read before one must not fill the cache
+_workspaces_generation = 0  # pylint: disable=invalid-name
+
+def invalidate_workspaces_cache():
+    """
+    Drop the cached workspace listing so the next read goes to the database.
+
+    Must be called after any change to a workspace or one of its schedules,
+    including writes made through `database.bulk_create` and
+    `database.bulk_set_status`, which do not call it themselves.
+    """
+    global _workspaces_generation  # pylint: disable=global-statement
+    with _workspaces_cache_lock:
+        _workspaces_generation += 1
+        _workspaces_cache.clear()
+
 class WorkspaceService:
     """
      Service class for managing workspaces and their schedules.
@@ -28,47 +51,64 @@ class WorkspaceService:
     def get_workspaces(self):
         """
         Get all workspaces, including their schedules.
-        """
-        workspaces = WorkspaceModel.select().dicts()
-        results = []
-
-        for workspace in workspaces:
-            schedules = ScheduleModel.select().where(
-                ScheduleModel.workspace == workspace['id']
-            ).dicts()
-            workspace['schedules'] = list(schedules)
-            results.append(workspace)
 
+        Schedules are prefetched, so this issues two queries regardless of
+        the number of workspaces. The result is cached for a short time.
+        """
+        with _workspaces_cache_lock:
+            results = _workspaces_cache.get('all')
+            generation = _workspaces_generation
+        if results is not None:
+            return results
+
+        workspaces = prefetch(WorkspaceModel.select(), ScheduleModel.select())
+        results = [
+            {
+                **workspace.__data__,
+                'schedules': [schedule.__data__ for schedule in workspace.schedules]
+            }
+            for workspace in workspaces
+        ]
+        with _workspaces_cache_lock:
+            # A listing read before an invalidation may predate the write behind it
+            if generation == _workspaces_generation:
+                _workspaces_cache['all'] = results
         return results
 
     def get_workspace(self, workspace_id: int):
         """
         Get a specific workspace along with its schedules.
         """
-        try:
-            workspace = WorkspaceModel.get(WorkspaceModel.id == workspace_id)
-            schedules = ScheduleModel.select().where(ScheduleModel.workspace==workspace_id).dicts()
-            return {**workspace.__data__, 'schedules': list(schedules)}
-        except DoesNotExist:
+        workspace = WorkspaceModel.select().where(WorkspaceModel.id == workspace_id).dicts().first()
+        if workspace is None:
             return "Workspace not found"
+        schedules = ScheduleModel.select().where(ScheduleModel.workspace==workspace_id).dicts()
+        workspace['schedules'] = list(schedules)
+        return workspace
 
     def create_workspace(self, workspace: Workspace = Body(...)):
         """
         Create a new workspace.
         """
-        WorkspaceModel.create(
+        WorkspaceModel.insert(  # pylint: disable=no-value-for-parameter
             type=workspace.type.value,
             capacity=workspace.capacity,
             hourlyRate=workspace.hourlyRate,
             created_by=workspace.createdBy
-        )
+        ).execute()
+        invalidate_workspaces_cache()
         return workspace
 
-    def update_workspace(self, workspace_id: int, workspace_data: dict):
+    def update_workspace(self, workspace_id: int, workspace_data: WorkspaceUpdate):
         """
         Update an existing workspace.
         """
-        WorkspaceModel.update(workspace_data).where(WorkspaceModel.id == workspace_id).execute()
+        fields = workspace_data.model_dump(mode="json", exclude_unset=True)
+        if "createdBy" in fields:
+            fields["created_by"] = fields.pop("createdBy")
+        if fields:
+            WorkspaceModel.update(fields).where(WorkspaceModel.id == workspace_id).execute()
+        invalidate_workspaces_cache()
         return "Workspace updated successfully"
 
     def delete_workspace(self, workspace_id: int):
@@ -81,20 +121,18 @@ class WorkspaceService:
         Returns:
             str: A message indicating the result of the deletion attempt.
         """
-        try:
-            # Check for future schedules
-            future_schedules = ScheduleModel.select().where(
-                (ScheduleModel.id == workspace_id) &
-                (ScheduleModel.opening_time > datetime.now())
-            )
-
-            if future_schedules.exists():
-                return "Cannot delete workspace with future schedules assigned."
-
-            # Delete the workspace if no future schedules
-            workspace = WorkspaceModel.get(WorkspaceModel.id == workspace_id)
-            workspace.delete_instance()
-            return "Workspace deleted successfully"
-
-        except DoesNotExist:
+        # Check for future schedules, against the database server's clock
+        future_schedules = ScheduleModel.select().where(
+            (ScheduleModel.workspace == workspace_id) &
+            (ScheduleModel.opening_time > SQL('CURRENT_TIMESTAMP'))
+        )
+
+        if future_schedules.exists():
+            return "Cannot delete workspace with future schedules assigned."
+
+        # Delete the workspace if no future schedules; past schedules cascade
+        deleted = WorkspaceModel.delete().where(WorkspaceModel.id == workspace_id).execute()
+        if not deleted:
             return "Workspace not found"
+        invalidate_workspaces_cache()
+        return "Workspace deleted successfully"